@@ -4,8 +4,9 @@ import logging
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse
 
+from app.api.responses import ORJSONResponse
 from app.models.ticket import EventType, Ticket, TicketStatus
 from app.services.notification import NotificationService
 
@@ -46,14 +47,14 @@ async def acknowledge_ticket_via_link(
     # Check if already acknowledged
     if ticket.status == TicketStatus.ACKNOWLEDGED:
         if format == "json":
-            return JSONResponse(content={"status": "already_acknowledged", "ticket_id": str(ticket.id)})
+            return ORJSONResponse(content={"status": "already_acknowledged", "ticket_id": str(ticket.id)})
         if format == "html":
             return HTMLResponse(content="<html><body><h1>Already acknowledged</h1></body></html>")
         return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=status.HTTP_302_FOUND)
 
     if ticket.status == TicketStatus.RESOLVED:
         if format == "json":
-            return JSONResponse(content={"status": "already_resolved", "ticket_id": str(ticket.id)})
+            return ORJSONResponse(content={"status": "already_resolved", "ticket_id": str(ticket.id)})
         if format == "html":
             return HTMLResponse(content="<html><body><h1>Already resolved</h1></body></html>")
         return RedirectResponse(url=f"/tickets/{ticket_id}", status_code=status.HTTP_302_FOUND)
@@ -78,7 +79,7 @@ async def acknowledge_ticket_via_link(
         logger.error(f"Failed to send ack notification for ticket {ticket_id}: {e}")
 
     if format == "json":
-        return JSONResponse(content={"status": "acknowledged", "ticket_id": str(ticket.id)})
+        return ORJSONResponse(content={"status": "acknowledged", "ticket_id": str(ticket.id)})
 
     if format == "html":
         return HTMLResponse(
@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query, Request, status
-from fastapi.responses import JSONResponse
 
+from app.api.responses import ORJSONResponse
 from app.models.namespace import Namespace
 from app.models.notification_group import NotificationGroup
 from app.models.project import Project
@@ -18,7 +18,7 @@ from app.sources.grafana import GrafanaSource
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/webhook", tags=["webhook"])
+router = APIRouter(prefix="/webhook", tags=["webhook"], default_response_class=ORJSONResponse)
 
 # Source parsers registry
 _sources: dict[str, BaseSource] = {}
@@ -99,7 +99,7 @@ async def receive_webhook(
     source: str = Query(
         default="custom", description="Source type (grafana, alertmanager, custom)"
     ),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Receive webhook and create ticket.
 
     URL format: /webhook/{namespace_slug}/{project_id}?source=grafana
@@ -121,7 +121,7 @@ async def receive_webhook(
         )
 
     if not project.is_active:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "status": "ignored",
@@ -163,7 +163,7 @@ async def receive_webhook(
                 f"Resolved {len(pending_tickets)} pending tickets for project {project_id}"
             )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "status": "resolved",
@@ -174,7 +174,7 @@ async def receive_webhook(
 
     if info.get("status") == TicketStatus.IGNORED:
         # HACK: this is for aliyun where normal messages should not create ticket
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "status": "ignored",
@@ -206,7 +206,7 @@ async def receive_webhook(
         await ticket.insert()
 
         logger.info(f"Created ticket {ticket.id} for project {project_id} (silenced)")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_200_OK,
             content={
                 "status": "silenced",
@@ -246,7 +246,7 @@ async def receive_webhook(
     ticket.notification_count = 1
     await ticket.save()
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_200_OK,
         content={
             "status": "ok",
@@ -11,9 +11,9 @@ from typing import Any
 from zoneinfo import ZoneInfo
 import os
 
-import httpx
-
 from app.channels.base import BaseChannel
+from app.channels.http import get_http_client
+from app.config import get_settings
 from app.models.alert import Alert, AlertGroup
 from app.models.event import Event
 
@@ -153,7 +153,6 @@ class FeishuChannel(BaseChannel):
 
     def _build_ticket_card(self, event: Event) -> dict[str, Any]:
         """Build a card message for ticket notification with ack link."""
-        from app.config import get_settings
         settings = get_settings()
 
         meta = event.meta or {}
@@ -269,15 +268,15 @@ class FeishuChannel(BaseChannel):
             message["timestamp"] = timestamp
             message["sign"] = sign
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self._webhook_url, json=message)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.post(self._webhook_url, json=message, timeout=30.0)
+        response.raise_for_status()
 
-            result = response.json()
-            if result.get("code") != 0:
-                logger.error(f"Feishu API error: {result}")
-                return False
+        result = response.json()
+        if result.get("code") != 0:
+            logger.error(f"Feishu API error: {result}")
+            return False
 
-            logger.info("Alert sent to Feishu successfully")
-            return True
+        logger.info("Alert sent to Feishu successfully")
+        return True
 
@@ -0,0 +1,49 @@
+"""Shared HTTP client for webhook-based channels."""
+
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Global client instance, reused across sends for keep-alive and pooling
+_client: httpx.AsyncClient | None = None
+
+
+def _create_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+async def init_http_client() -> None:
+    """Create the shared HTTP client."""
+    global _client
+
+    if _client is None:
+        _client = _create_client()
+        logger.info("Shared HTTP client created")
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+
+    if _client:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client.
+
+    Created lazily when used outside the application lifespan
+    (e.g. scripts calling channels directly).
+    """
+    global _client
+
+    if _client is None:
+        _client = _create_client()
+    return _client
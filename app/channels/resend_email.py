@@ -15,9 +15,8 @@ from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
-import httpx
-
 from app.channels.base import BaseChannel
+from app.channels.http import get_http_client
 from app.models.event import Event
 
 logger = logging.getLogger(__name__)
@@ -129,18 +128,20 @@ class ResendEmailChannel(BaseChannel):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=self._timeout_s) as client:
-            resp = await client.post(self._api_url, headers=headers, json=payload)
-            if resp.status_code >= 400:
-                logger.error(
-                    "Resend API error: status=%s body=%s",
-                    resp.status_code,
-                    resp.text,
-                )
-                resp.raise_for_status()
-
-            data = resp.json()
-            logger.info("Alert sent via Resend: %s", data)
-            return True
+        client = get_http_client()
+        resp = await client.post(
+            self._api_url, headers=headers, json=payload, timeout=self._timeout_s
+        )
+        if resp.status_code >= 400:
+            logger.error(
+                "Resend API error: status=%s body=%s",
+                resp.status_code,
+                resp.text,
+            )
+            resp.raise_for_status()
+
+        data = resp.json()
+        logger.info("Alert sent via Resend: %s", data)
+        return True
 
 
@@ -1,11 +1,12 @@
 """Slack notification channel using Incoming Webhooks."""
 
+import json
 import logging
 from typing import Any
 
-import httpx
-
 from app.channels.base import BaseChannel
+from app.channels.http import get_http_client
+from app.config import get_settings
 from app.models.event import Event
 
 logger = logging.getLogger(__name__)
@@ -40,8 +41,6 @@ class SlackChannel(BaseChannel):
 
     def _build_text_message(self, event: Event) -> dict[str, Any]:
         """Build a simple text message for generic events."""
-        import json
-
         payload_json = json.dumps(event.payload, ensure_ascii=False, indent=2, default=str)
         labels_json = json.dumps(event.labels or {}, ensure_ascii=False, default=str)
         text = (
@@ -53,8 +52,6 @@ class SlackChannel(BaseChannel):
 
     def _build_ticket_blocks(self, event: Event) -> dict[str, Any]:
         """Build a rich Block Kit message for ticket notifications with ack link."""
-        from app.config import get_settings
-
         settings = get_settings()
 
         meta = event.meta or {}
@@ -195,14 +192,16 @@ class SlackChannel(BaseChannel):
 
         headers = {"Content-Type": "application/json"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self._webhook_url, headers=headers, json=message)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.post(
+            self._webhook_url, headers=headers, json=message, timeout=30.0
+        )
+        response.raise_for_status()
 
-            # Slack webhooks return "ok" as plain text on success
-            if response.text != "ok":
-                logger.error(f"Slack webhook error: {response.text}")
-                return False
+        # Slack webhooks return "ok" as plain text on success
+        if response.text != "ok":
+            logger.error(f"Slack webhook error: {response.text}")
+            return False
 
-            logger.info("Message sent to Slack webhook successfully")
-            return True
+        logger.info("Message sent to Slack webhook successfully")
+        return True
@@ -1,6 +1,7 @@
 """Twilio SMS notification channel."""
 
 import logging
+from functools import lru_cache
 from typing import List
 
 from twilio.rest import Client
@@ -13,6 +14,12 @@ from app.models.event import Event
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _twilio_client(account_sid: str, auth_token: str) -> Client:
+    """Get a Twilio client shared by every channel using these credentials."""
+    return Client(account_sid, auth_token)
+
+
 class TwilioSMSChannel(BaseChannel):
     """Send notifications via Twilio SMS."""
 
@@ -45,7 +52,7 @@ class TwilioSMSChannel(BaseChannel):
     def _get_client(self) -> Client:
         """Get or create Twilio client."""
         if self._client is None:
-            self._client = Client(self._account_sid, self._auth_token)
+            self._client = _twilio_client(self._account_sid, self._auth_token)
         return self._client
 
     def _format_message(self, event: Event) -> str:
@@ -0,0 +1,11 @@
+"""UTC timestamp helper."""
+
+from datetime import UTC, datetime
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching stored model timestamps.
+
+    Replaces the deprecated datetime.utcnow().
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
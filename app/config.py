@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     port: int = Field(default=5032)
     log_level: str = Field(default="INFO")
     base_url: str = Field(default="http://localhost:5032")
+    template_auto_reload: bool = Field(default=False)  # Re-check templates on disk
 
     # MongoDB
     mongodb_uri: str = Field(default="mongodb://localhost:27017")
@@ -58,7 +59,7 @@ class Settings(BaseSettings):
         return Path(self.routes_config)
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
 
@@ -12,6 +12,7 @@ from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.webhook import get_sources
+from app.channels.http import close_http_client, init_http_client
 from app.config import get_settings
 from app.database import close_db, init_db
 
@@ -40,6 +41,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize MongoDB
     await init_db()
 
+    # Shared HTTP client for webhook channels (keep-alive across sends)
+    await init_http_client()
+
     # Create initial admin user if needed
     from app.auth.init_admin import ensure_admin_exists
 
@@ -50,6 +54,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await TemplateService.ensure_builtin_templates()
 
+    # Backfill/repair the denormalized per-namespace project counters
+    from app.web.namespaces import reconcile_project_counts
+
+    await reconcile_project_counts()
+
+    # Compile page templates up front
+    from app.web.templates import precompile_templates
+
+    logger.info(f"Precompiled {precompile_templates()} page template(s)")
+
     # Register source parsers
     # from app.sources.aliyun_pai import AliyunSource
 
@@ -69,6 +83,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Cleanup on shutdown
     stop_scheduler()
+    await close_http_client()
     await close_db()
     sources.clear()
     logger.info("Bullet stopped")
@@ -6,6 +6,8 @@ from typing import Annotated
 from beanie import Document, Indexed
 from pydantic import Field
 
+from app.clock import utcnow
+
 
 class Contact(Document):
     """Contact entry in the address book.
@@ -19,12 +21,15 @@ class Contact(Document):
     feishu_webhook_url: str = ""
     slack_webhook_url: str = ""
     note: str = ""
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     class Settings:
         name = "contacts"
         use_state_management = True
+        indexes = [
+            [("name", 1), ("_id", 1)],  # Keyset pagination on the list page
+        ]
 
     def has_feishu(self) -> bool:
         return bool(self.feishu_webhook_url)
@@ -16,6 +16,7 @@ class Namespace(Document):
     name: str
     slug: Annotated[str, Indexed(str, unique=True)]
     description: str = ""
+    project_count: int = 0  # Denormalized, maintained on project create/delete
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -90,7 +90,10 @@ class Ticket(Document):
         indexes = [
             "status",
             "created_at",
-            [("project_id", 1), ("status", 1)],
+            # Ticket list: filter by project and/or status, newest first.
+            # Also serves plain (project_id, status) lookups as a prefix.
+            [("project_id", 1), ("status", 1), ("created_at", -1)],
+            [("status", 1), ("created_at", -1)],
             [("project_id", 1), ("created_at", -1)],
         ]
 
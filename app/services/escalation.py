@@ -11,6 +11,7 @@ from app.models.notification_group import NotificationGroup
 from app.models.project import Project
 from app.models.ticket import EventType, Ticket, TicketStatus
 from app.services.notification import NotificationService
+from app.services.template import TemplateService
 
 logger = logging.getLogger(__name__)
 
@@ -163,7 +164,6 @@ async def _repeat_notification(ticket: Ticket, group: NotificationGroup, project
     logger.info(f"Repeating notification for ticket {ticket.id} to group {group.name}")
 
     # Get template for project
-    from app.services.template import TemplateService
     template = await TemplateService.get_template_for_project(project)
 
     # Send notification with repeat flag
@@ -202,7 +202,6 @@ async def _escalate_ticket(ticket: Ticket, new_level: int, group: NotificationGr
     ticket.updated_at = datetime.utcnow()
 
     # Get template for project
-    from app.services.template import TemplateService
     template = await TemplateService.get_template_for_project(project)
 
     # Send notification with escalation flag
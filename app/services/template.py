@@ -2,9 +2,11 @@
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Optional
 
-from jinja2 import BaseLoader, Environment, TemplateSyntaxError
+import orjson
+from jinja2 import BaseLoader, Environment, Template, TemplateSyntaxError
 
 from app.config import get_settings
 from app.models.notification_template import BUILTIN_TEMPLATES, NotificationTemplate
@@ -24,7 +26,8 @@ def _json_escape(value: Any) -> str:
     if value is None:
         return ""
     s = str(value)
-    # Use json.dumps to properly escape, then strip the surrounding quotes
+    # Use json.dumps to properly escape, then strip the surrounding quotes.
+    # Not orjson: it rejects lone surrogates, which json.dumps escapes as \udXXX
     escaped = json.dumps(s)
     # Remove the surrounding quotes that json.dumps adds
     return escaped[1:-1]
@@ -37,6 +40,16 @@ _jinja_env.filters["json_escape"] = _json_escape
 _jinja_env.filters["je"] = _json_escape  # Short alias
 
 
+@lru_cache(maxsize=256)
+def _compile_template(template_str: str) -> Template:
+    """Compile a template string, reusing the result for identical sources.
+
+    Keyed by the source itself so edited templates (or in-memory fallbacks
+    without an id) never hit a stale entry.
+    """
+    return _jinja_env.from_string(template_str)
+
+
 class TemplateService:
     """Service for rendering notification templates."""
 
@@ -133,7 +146,7 @@ class TemplateService:
             return ""
 
         try:
-            template = _jinja_env.from_string(template_str)
+            template = _compile_template(template_str)
             return template.render(**context)
         except TemplateSyntaxError as e:
             logger.error(f"Template syntax error: {e}")
@@ -153,10 +166,16 @@ class TemplateService:
         if not template.feishu_card:
             return None
 
+        rendered = TemplateService.render_string(template.feishu_card, context)
+        if not rendered:
+            return None
+
+        try:
+            return orjson.loads(rendered)
+        except orjson.JSONDecodeError:
+            # orjson also rejects lone surrogate escapes; retry with the stdlib
+            pass
         try:
-            rendered = TemplateService.render_string(template.feishu_card, context)
-            if not rendered:
-                return None
             return json.loads(rendered)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse rendered Feishu card as JSON: {e}")
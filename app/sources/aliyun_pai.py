@@ -13,6 +13,25 @@ class AliyunSource(BaseSource):
     # Task statuses that indicate the job is complete/resolved
     RESOLVED_STATUSES = {"Succeeded", "Failed", "Stopped"}
 
+    # Task status -> alert severity (unknown statuses map to "warning")
+    _SEVERITY_MAP: dict[str, str] = {
+        "Failed": "critical",
+        "Stopped": "warning",
+        "Succeeded": "info",
+        "Running": "info",
+        "Queuing": "info",
+        "EnvPreparing": "info",
+    }
+
+    # Task status -> alert status (unknown statuses are "firing")
+    _STATUS_MAP: dict[str, AlertStatus] = {
+        "Succeeded": "ignored",
+        "Running": "ignored",
+        "Queuing": "ignored",
+        "EnvPreparing": "ignored",
+        "": "ignored",
+    }
+
     @property
     def name(self) -> str:
         return "aliyun_pai"
@@ -48,25 +67,30 @@ class AliyunSource(BaseSource):
         # Parse start time
         starts_at = self._parse_timestamp(start_time_str)
 
-        # Build labels
+        # Build labels, skipping empty values
         labels = {
-            "task_name": task_name,
-            "task_id": task_id,
-            "task_status": task_status,
-            "workspace": workspace,
-            "region": region,
-            "creator": creator,
+            k: v
+            for k, v in (
+                ("task_name", task_name),
+                ("task_id", task_id),
+                ("task_status", task_status),
+                ("workspace", workspace),
+                ("region", region),
+                ("creator", creator),
+            )
+            if v
         }
-        # Filter out empty values
-        labels = {k: v for k, v in labels.items() if v}
 
-        # Build annotations
+        # Build annotations, skipping empty values
         annotations = {
-            "event": event,
-            "message": message,
-            "creator_uid": creator_uid,
+            k: v
+            for k, v in (
+                ("event", event),
+                ("message", message),
+                ("creator_uid", creator_uid),
+            )
+            if v
         }
-        annotations = {k: v for k, v in annotations.items() if v}
 
         alert = Alert(
             source=self.name,
@@ -134,23 +158,8 @@ class AliyunSource(BaseSource):
 
     def _map_severity(self, task_status: str) -> str:
         """Map Aliyun task status to alert severity."""
-        severity_map = {
-            "Failed": "critical",
-            "Stopped": "warning",
-            "Succeeded": "info",
-            "Running": "info",
-            "Queuing": "info",
-            "EnvPreparing": "info",
-        }
-        return severity_map.get(task_status, "warning")
+        return self._SEVERITY_MAP.get(task_status, "warning")
 
     def _map_status(self, task_status: str) -> AlertStatus:
         """Map Aliyun task status to alert status."""
-        status_map: dict[str, AlertStatus] = {
-            "Succeeded": "ignored",
-            "Running": "ignored",
-            "Queuing": "ignored",
-            "EnvPreparing": "ignored",
-            "": "ignored",
-        }
-        return status_map.get(task_status, "firing")
+        return self._STATUS_MAP.get(task_status, "firing")
@@ -1,69 +1,173 @@
 """Contact management routes."""
 
-from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Optional
 
-from fastapi import APIRouter, Form, Request, status
+from beanie import PydanticObjectId
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
+from app.clock import utcnow
 from app.deps import AdminUser, CurrentUser
 from app.models.contact import Contact
 from app.models.user import User
+from app.web.contacts_cache import invalidate_contacts_map
 from app.web.templates import templates
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
+def _parse_csv(value: str) -> list[str]:
+    """Split a comma-separated form field into non-empty, stripped items."""
+    return list(filter(None, map(str.strip, value.split(","))))
+
+
+# Precomputed asterisk runs covering realistic phone and email-local lengths
+_STARS = tuple("*" * i for i in range(65))
+
+
+def _stars(n: int) -> str:
+    return _STARS[n] if n < len(_STARS) else "*" * n
+
+
+@lru_cache(maxsize=4096)
 def mask_phone(phone: str) -> str:
     """Mask phone number, showing only first 3 and last 4 digits."""
     if len(phone) <= 7:
-        return phone[:1] + "*" * (len(phone) - 2) + phone[-1:] if len(phone) > 2 else phone
-    return phone[:3] + "*" * (len(phone) - 7) + phone[-4:]
+        return phone[:1] + _stars(len(phone) - 2) + phone[-1:] if len(phone) > 2 else phone
+    return phone[:3] + _stars(len(phone) - 7) + phone[-4:]
 
 
+@lru_cache(maxsize=4096)
 def mask_email(email: str) -> str:
     """Mask email, hiding characters before @."""
     if "@" not in email:
         return email
     local, domain = email.rsplit("@", 1)
     if len(local) <= 2:
-        masked_local = "*" * len(local)
+        masked_local = _stars(len(local))
     else:
-        masked_local = local[0] + "*" * (len(local) - 2) + local[-1]
+        masked_local = local[0] + _stars(len(local) - 2) + local[-1]
     return f"{masked_local}@{domain}"
 
 
-def mask_contact_for_display(contact: Contact, user: User) -> dict:
-    """Create a display dict with masked data for non-admin users."""
-    data = {
-        "id": contact.id,
-        "name": contact.name,
-        "feishu_webhook_url": contact.feishu_webhook_url,
-        "slack_webhook_url": contact.slack_webhook_url,
-        "note": contact.note,
-        "created_at": contact.created_at,
-        "updated_at": contact.updated_at,
-    }
-    
+def _is_admin_context(info: ValidationInfo) -> bool:
+    return bool(info.context and info.context.get("is_admin"))
+
+
+class ContactListView(BaseModel):
+    """Projection of the Contact fields rendered by the list view."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    phones: list[str] = Field(default_factory=list)
+    emails: list[str] = Field(default_factory=list)
+    feishu_webhook_url: str = ""
+    slack_webhook_url: str = ""
+    note: str = ""
+
+
+class ContactDisplay(BaseModel):
+    """Contact as rendered in the list view.
+
+    Phones and emails are masked unless validated with context
+    ``{"is_admin": True}``.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: Optional[PydanticObjectId] = None
+    name: str
+    phones: list[str]
+    emails: list[str]
+    feishu_webhook_url: str = ""
+    slack_webhook_url: str = ""
+    note: str = ""
+
+    @field_validator("phones")
+    @classmethod
+    def _mask_phones(cls, phones: list[str], info: ValidationInfo) -> list[str]:
+        if _is_admin_context(info):
+            return phones
+        return list(map(mask_phone, phones))
+
+    @field_validator("emails")
+    @classmethod
+    def _mask_emails(cls, emails: list[str], info: ValidationInfo) -> list[str]:
+        if _is_admin_context(info):
+            return emails
+        return list(map(mask_email, emails))
+
+
+def mask_contact_for_display(
+    contact: Contact | ContactListView, user: User
+) -> ContactDisplay:
+    """Create a display model with masked data for non-admin users."""
+    return ContactDisplay.model_validate(
+        contact, context={"is_admin": user.is_admin()}
+    )
+
+
+def _keyset_query(after: Optional[str], after_id: Optional[str]) -> dict:
+    """Build the filter for the contact page following (after, after_id)."""
+    if after is None:
+        return {}
+    # Names are not unique, so break ties on _id
+    query: dict = {"name": {"$gt": after}}
+    if after_id and ObjectId.is_valid(after_id):
+        query = {
+            "$or": [
+                query,
+                {"name": after, "_id": {"$gt": ObjectId(after_id)}},
+            ]
+        }
+    return query
+
+
+@router.get("/", response_class=HTMLResponse)
+async def list_contacts(
+    request: Request,
+    user: CurrentUser,
+    after: Optional[str] = Query(None),
+    after_id: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+):
+    """List contacts, paginated by (name, id) keyset."""
+    # Fetch one extra row to know whether a next page exists
+    cursor = (
+        Contact.find(_keyset_query(after, after_id))
+        .sort(Contact.name, "_id")
+        .limit(limit + 1)
+        .project(ContactListView)
+    )
+    contacts: list[ContactListView] | list[ContactDisplay]
     if user.is_admin():
-        data["phones"] = contact.phones
-        data["emails"] = contact.emails
+        # Admins see unmasked data, so the projection renders as-is
+        contacts = await cursor.to_list()
     else:
-        data["phones"] = [mask_phone(p) for p in contact.phones]
-        data["emails"] = [mask_email(e) for e in contact.emails]
-    
-    return data
+        # Mask sensitive data while iterating the cursor, so the raw rows
+        # are never held alongside the masked copies
+        contacts = [mask_contact_for_display(c, user) async for c in cursor]
 
+    next_cursor = None
+    if len(contacts) > limit:
+        contacts.pop()
+        last = contacts[-1]
+        next_cursor = {"after": last.name, "after_id": str(last.id)}
 
-@router.get("/", response_class=HTMLResponse)
-async def list_contacts(request: Request, user: CurrentUser):
-    """List all contacts."""
-    contacts = await Contact.find().sort(Contact.name).to_list()
-    # Mask sensitive data for non-admin users
-    masked_contacts = [mask_contact_for_display(c, user) for c in contacts]
     return templates.TemplateResponse(
         request,
         "contacts/list.html",
-        {"user": user, "contacts": masked_contacts},
+        {
+            "user": user,
+            "contacts": contacts,
+            "is_first_page": after is None,
+            "next_cursor": next_cursor,
+            "limit": limit,
+        },
     )
 
 
@@ -77,7 +181,7 @@ async def new_contact_form(request: Request, admin: AdminUser):
     )
 
 
-@router.post("/new", response_class=HTMLResponse)
+@router.post("/new")
 async def create_contact(
     name: str = Form(...),
     phones: str = Form(""),
@@ -88,8 +192,8 @@ async def create_contact(
 ):
     """Create a new contact. Admin only."""
     # Parse comma-separated phones and emails
-    phone_list = [p.strip() for p in phones.split(",") if p.strip()]
-    email_list = [e.strip() for e in emails.split(",") if e.strip()]
+    phone_list = _parse_csv(phones)
+    email_list = _parse_csv(emails)
 
     contact = Contact(
         name=name,
@@ -100,14 +204,29 @@ async def create_contact(
         note=note,
     )
     await contact.insert()
+    invalidate_contacts_map()
 
     return RedirectResponse(url="/contacts", status_code=status.HTTP_302_FOUND)
 
 
+def parse_oid(contact_id: str) -> PydanticObjectId:
+    """Parse the contact_id path parameter, 404ing on malformed ids."""
+    try:
+        return PydanticObjectId(contact_id)
+    except InvalidId:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Contact not found",
+        )
+
+
+ContactOid = Annotated[PydanticObjectId, Depends(parse_oid)]
+
+
 @router.get("/{contact_id}", response_class=HTMLResponse)
-async def edit_contact_form(request: Request, contact_id: str, admin: AdminUser):
+async def edit_contact_form(request: Request, oid: ContactOid, admin: AdminUser):
     """Display edit contact form. Admin only."""
-    contact = await Contact.get(contact_id)
+    contact = await Contact.get(oid)
     if not contact:
         return RedirectResponse(url="/contacts", status_code=status.HTTP_302_FOUND)
 
@@ -118,9 +237,9 @@ async def edit_contact_form(request: Request, contact_id: str, admin: AdminUser)
     )
 
 
-@router.post("/{contact_id}", response_class=HTMLResponse)
+@router.post("/{contact_id}")
 async def update_contact(
-    contact_id: str,
+    oid: ContactOid,
     name: str = Form(...),
     phones: str = Form(""),
     emails: str = Form(""),
@@ -129,33 +248,34 @@ async def update_contact(
     note: str = Form(""),
 ):
     """Update a contact. Admin only."""
-    contact = await Contact.get(contact_id)
-    if not contact:
-        return RedirectResponse(url="/contacts", status_code=status.HTTP_302_FOUND)
-
     # Parse comma-separated phones and emails
-    phone_list = [p.strip() for p in phones.split(",") if p.strip()]
-    email_list = [e.strip() for e in emails.split(",") if e.strip()]
+    phone_list = _parse_csv(phones)
+    email_list = _parse_csv(emails)
 
-    contact.name = name
-    contact.phones = phone_list
-    contact.emails = email_list
-    contact.feishu_webhook_url = feishu_webhook_url
-    contact.slack_webhook_url = slack_webhook_url
-    contact.note = note
-    contact.updated_at = datetime.utcnow()
-
-    await contact.save()
+    # Single atomic update; a missing contact simply matches nothing
+    await Contact.find_one(Contact.id == oid).update(
+        {
+            "$set": {
+                Contact.name: name,
+                Contact.phones: phone_list,
+                Contact.emails: email_list,
+                Contact.feishu_webhook_url: feishu_webhook_url,
+                Contact.slack_webhook_url: slack_webhook_url,
+                Contact.note: note,
+                Contact.updated_at: utcnow(),
+            }
+        }
+    )
+    invalidate_contacts_map()
 
     return RedirectResponse(url="/contacts", status_code=status.HTTP_302_FOUND)
 
 
 @router.post("/{contact_id}/delete")
-async def delete_contact(contact_id: str, admin: AdminUser):
+async def delete_contact(oid: ContactOid, admin: AdminUser):
     """Delete a contact. Admin only."""
-    contact = await Contact.get(contact_id)
-    if contact:
-        await contact.delete()
+    await Contact.find_one(Contact.id == oid).delete()
+    invalidate_contacts_map()
 
     return RedirectResponse(url="/contacts", status_code=status.HTTP_302_FOUND)
 
@@ -0,0 +1,23 @@
+"""Short-lived in-process cache of the contact lookup map."""
+
+from app.models.contact import Contact
+from app.web.ttl_cache import TTLCache
+
+
+async def _load_contacts_map() -> dict[str, Contact]:
+    contacts = await Contact.find().to_list()
+    return {str(c.id): c for c in contacts}
+
+
+# Contacts change rarely but are looked up on most group/project pages
+_contacts_cache = TTLCache(_load_contacts_map)
+
+
+async def get_contacts_map() -> dict[str, Contact]:
+    """Get all contacts keyed by string id."""
+    return await _contacts_cache.get()
+
+
+def invalidate_contacts_map() -> None:
+    """Drop the cached map after a contact is created, updated or deleted."""
+    _contacts_cache.invalidate()
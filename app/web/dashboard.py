@@ -1,10 +1,12 @@
 """Dashboard routes."""
 
+import asyncio
+
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
 from app.deps import CurrentUser
-from app.models import Contact, Namespace, NotificationGroup, Project, Ticket, TicketStatus, User
+from app.web.dashboard_queries import fetch_dashboard_stats, fetch_recent_tickets
 from app.web.templates import templates
 
 router = APIRouter(tags=["dashboard"])
@@ -13,18 +15,11 @@ router = APIRouter(tags=["dashboard"])
 @router.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request, user: CurrentUser):
     """Display dashboard with system overview."""
-    # Gather statistics
-    stats = {
-        "namespaces": await Namespace.count(),
-        "projects": await Project.count(),
-        "contacts": await Contact.count(),
-        "pending_tickets": await Ticket.find(Ticket.status == TicketStatus.PENDING).count(),
-        "users": await User.count(),
-        "notification_groups": await NotificationGroup.count(),
-    }
-
-    # Get recent tickets
-    recent_tickets = await Ticket.find().sort(-Ticket.created_at).limit(5).to_list() # type: ignore
+    # Fetch statistics (one aggregation) and recent tickets concurrently
+    stats, recent_tickets = await asyncio.gather(
+        fetch_dashboard_stats(),
+        fetch_recent_tickets(),
+    )
 
     return templates.TemplateResponse(
         request,
@@ -0,0 +1,73 @@
+"""Aggregated MongoDB queries backing the dashboard."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, Field
+
+from app.models import Contact, Namespace, NotificationGroup, Project, Ticket, TicketStatus, User
+
+
+class TicketCardView(BaseModel):
+    """Projection of the Ticket fields shown in the dashboard's recent list."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    title: str = ""
+    source: str
+    status: TicketStatus
+    created_at: datetime
+
+
+# Dashboard stat key -> (model, optional filter)
+_STAT_SOURCES: dict[str, tuple[type[Document], Optional[dict[str, Any]]]] = {
+    "namespaces": (Namespace, None),
+    "projects": (Project, None),
+    "contacts": (Contact, None),
+    "pending_tickets": (Ticket, {"status": TicketStatus.PENDING.value}),
+    "users": (User, None),
+    "notification_groups": (NotificationGroup, None),
+}
+
+
+def _count_pipeline(key: str, match: Optional[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Build a pipeline that emits a single {_id: key, n: count} document."""
+    pipeline: list[dict[str, Any]] = [{"$match": match}] if match else []
+    pipeline.append({"$group": {"_id": key, "n": {"$sum": 1}}})
+    return pipeline
+
+
+async def fetch_dashboard_stats() -> dict[str, int]:
+    """Count every dashboard collection in a single aggregation round-trip.
+
+    The first collection is aggregated directly and the others are appended
+    with $unionWith. Empty collections emit no document and default to 0.
+    """
+    (first_key, (first_model, first_match)), *others = _STAT_SOURCES.items()
+
+    pipeline = _count_pipeline(first_key, first_match)
+    for key, (model, match) in others:
+        pipeline.append(
+            {
+                "$unionWith": {
+                    "coll": model.get_collection_name(),
+                    "pipeline": _count_pipeline(key, match),
+                }
+            }
+        )
+
+    stats = dict.fromkeys(_STAT_SOURCES, 0)
+    for doc in await first_model.aggregate(pipeline).to_list():
+        stats[doc["_id"]] = doc["n"]
+    return stats
+
+
+async def fetch_recent_tickets(limit: int = 5) -> list[TicketCardView]:
+    """Fetch the newest tickets, walking the created_at index backwards."""
+    return (
+        await Ticket.find()
+        .sort(-Ticket.created_at) # type: ignore
+        .limit(limit)
+        .project(TicketCardView)
+        .to_list()
+    )
@@ -1,16 +1,21 @@
 """Namespace and Project management routes."""
 
+import asyncio
 import logging
 import re
-import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
+from beanie import PydanticObjectId
+from bson import ObjectId
 from fastapi import APIRouter, Request, status
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from pydantic import BaseModel, Field
+from pymongo.errors import DuplicateKeyError
 
 from app.config import get_settings
 from app.deps import CurrentUser
-from app.models.contact import Contact
 from app.models.namespace import Namespace
 from app.models.notification_group import NotificationGroup
 from app.models.notification_template import NotificationTemplate
@@ -18,6 +23,9 @@ from app.models.project import SILENCE_DURATION_OPTIONS, EscalationConfig, Proje
 from app.models.ticket import Ticket, TicketStatus
 from app.services.notification import NotificationService
 from app.services.template import TemplateService
+from app.web.contacts_cache import get_contacts_map
+from app.web.project_queries import fetch_project_detail
+from app.web.projects_cache import invalidate_all_projects
 from app.web.templates import templates
 
 logger = logging.getLogger(__name__)
@@ -33,37 +41,143 @@ SEVERITY_OPTIONS = [
     ("notice", "Notice - 通知"),
 ]
 
+# Fixed payload/labels for the in-memory test ticket (Pydantic copies them
+# on validation, so sharing the module-level dicts is safe)
+_TEST_TICKET_PAYLOAD = {"test": True}
+_TEST_TICKET_LABELS = {"env": "test", "type": "test_message"}
+# The test ticket is never persisted, so its ack link can never resolve;
+# a fixed token avoids drawing from OS entropy on every send
+_TEST_TICKET_ACK_TOKEN = "test"
+
+
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+
 
 def slugify(text: str) -> str:
     """Convert text to URL-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_DASH.sub("-", text)
     return text
 
 
+class NamespaceListView(BaseModel):
+    """Projection of the Namespace fields shown on the list page."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    slug: str
+    description: str = ""
+    project_count: int = 0
+
+
+class GroupOption(BaseModel):
+    """Projection of a NotificationGroup for the project form's picker."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+
+
+class TemplateOption(BaseModel):
+    """Projection of a NotificationTemplate for the project form's picker."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    description: str = ""
+    is_builtin: bool = False
+
+
+async def _load_form_options() -> tuple[list[GroupOption], list[TemplateOption]]:
+    """Fetch the notification groups and templates offered by the project form."""
+    return await asyncio.gather(
+        NotificationGroup.find()
+        .sort(NotificationGroup.name)
+        .project(GroupOption)
+        .to_list(),
+        NotificationTemplate.find()
+        .sort(NotificationTemplate.name)
+        .project(TemplateOption)
+        .to_list(),
+    )
+
+
+async def reconcile_project_counts() -> None:
+    """Recompute each Namespace.project_count from the projects collection.
+
+    Run at startup to backfill the counter and repair drift left by failed
+    writes between a project insert/delete and its counter update.
+    """
+    counts = {
+        doc["_id"]: doc["count"]
+        for doc in await Project.aggregate(
+            [{"$group": {"_id": "$namespace_id", "count": {"$sum": 1}}}]
+        ).to_list()
+    }
+
+    for ns in await Namespace.find().project(NamespaceListView).to_list():
+        count = counts.get(str(ns.id), 0)
+        if ns.project_count != count:
+            await Namespace.find_one(Namespace.id == ns.id).update(
+                {"$set": {Namespace.project_count: count}}
+            )
+
+
+# view_namespace data warmed by the prefetch endpoint, consumed on first use:
+# namespace_id -> (monotonic timestamp, namespace, projects)
+_PREFETCH_TTL_SECONDS = 5.0
+_PREFETCH_MAX_ENTRIES = 128
+_namespace_prefetch: OrderedDict[str, tuple[float, Namespace, list[Project]]] = (
+    OrderedDict()
+)
+
+
+async def _fetch_namespace_view(
+    namespace_id: str,
+) -> tuple[Namespace | None, list[Project]]:
+    """Run the queries behind view_namespace."""
+    namespace = await Namespace.get(namespace_id)
+    if not namespace:
+        return None, []
+
+    projects = (
+        await Project.find(Project.namespace_id == str(namespace.id))
+        .sort(Project.name)
+        .to_list()
+    )
+    return namespace, projects
+
+
+def _take_prefetched(namespace_id: str) -> tuple[Namespace, list[Project]] | None:
+    """Pop a fresh prefetched entry for a namespace, if any."""
+    entry = _namespace_prefetch.pop(namespace_id, None)
+    if entry is None or time.monotonic() - entry[0] >= _PREFETCH_TTL_SECONDS:
+        return None
+    return entry[1], entry[2]
+
+
+def _drop_prefetched(namespace_id: str) -> None:
+    """Discard prefetched data made stale by a namespace or project change."""
+    _namespace_prefetch.pop(namespace_id, None)
+
+
 # ==================== Namespace Routes ====================
 
 
 @router.get("/", response_class=HTMLResponse)
 async def list_namespaces(request: Request, user: CurrentUser):
     """List all namespaces."""
-    namespaces = await Namespace.find().sort(Namespace.name).to_list()
-
-    # Get project counts for each namespace
-    namespace_projects = {}
-    for ns in namespaces:
-        count = await Project.find(Project.namespace_id == str(ns.id)).count()
-        namespace_projects[str(ns.id)] = count
+    namespaces = (
+        await Namespace.find()
+        .sort(Namespace.name)
+        .project(NamespaceListView)
+        .to_list()
+    )
 
     return templates.TemplateResponse(
         request,
         "namespaces/list.html",
-        {
-            "user": user,
-            "namespaces": namespaces,
-            "namespace_projects": namespace_projects,
-        },
+        {"user": user, "namespaces": namespaces},
     )
 
 
@@ -92,9 +206,16 @@ async def create_namespace(request: Request, user: CurrentUser):
     if not slug:
         slug = slugify(name)
 
-    # Check if slug already exists
-    existing = await Namespace.find_one(Namespace.slug == slug)
-    if existing:
+    namespace = Namespace(
+        name=name,
+        slug=slug,
+        description=description,
+    )
+
+    # The unique index on slug rejects duplicates
+    try:
+        await namespace.insert()
+    except DuplicateKeyError:
         return templates.TemplateResponse(
             request,
             "namespaces/form.html",
@@ -102,34 +223,33 @@ async def create_namespace(request: Request, user: CurrentUser):
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    namespace = Namespace(
-        name=name,
-        slug=slug,
-        description=description,
-    )
-    await namespace.insert()
-
     return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
 
+@router.get("/{namespace_id}/prefetch", status_code=status.HTTP_204_NO_CONTENT)
+async def prefetch_namespace(namespace_id: str, user: CurrentUser):
+    """Warm view_namespace's queries ahead of navigation (triggered on hover)."""
+    namespace, projects = await _fetch_namespace_view(namespace_id)
+    if namespace:
+        _namespace_prefetch[namespace_id] = (time.monotonic(), namespace, projects)
+        _namespace_prefetch.move_to_end(namespace_id)
+        while len(_namespace_prefetch) > _PREFETCH_MAX_ENTRIES:
+            _namespace_prefetch.popitem(last=False)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.get("/{namespace_id}", response_class=HTMLResponse)
 async def view_namespace(request: Request, namespace_id: str, user: CurrentUser):
     """View namespace details and projects."""
-    namespace = await Namespace.get(namespace_id)
+    prefetched = _take_prefetched(namespace_id)
+    if prefetched:
+        namespace, projects = prefetched
+    else:
+        namespace, projects = await _fetch_namespace_view(namespace_id)
     if not namespace:
         return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
-    projects = (
-        await Project.find(Project.namespace_id == str(namespace.id))
-        .sort(Project.name)
-        .to_list()
-    )
-
-    # Get notification group count for each project (based on bound groups)
-    project_group_counts = {}
-    for proj in projects:
-        project_group_counts[str(proj.id)] = len(proj.notification_group_ids)
-
     settings = get_settings()
 
     return templates.TemplateResponse(
@@ -139,7 +259,6 @@ async def view_namespace(request: Request, namespace_id: str, user: CurrentUser)
             "user": user,
             "namespace": namespace,
             "projects": projects,
-            "project_group_counts": project_group_counts,
             "base_url": settings.base_url,
         },
     )
@@ -174,9 +293,16 @@ async def update_namespace(request: Request, namespace_id: str, user: CurrentUse
     desc_raw = form_data.get("description", "")
     description = desc_raw.strip() if isinstance(desc_raw, str) else ""
 
-    # Check if slug is taken by another namespace
-    existing = await Namespace.find_one(Namespace.slug == slug)
-    if existing and str(existing.id) != namespace_id:
+    namespace.name = name
+    namespace.slug = slug
+    namespace.description = description
+    namespace.updated_at = datetime.utcnow()
+
+    # The unique index on slug rejects a slug taken by another namespace;
+    # save_changes leaves the concurrently maintained project_count untouched
+    try:
+        await namespace.save_changes()
+    except DuplicateKeyError:
         return templates.TemplateResponse(
             request,
             "namespaces/form.html",
@@ -188,12 +314,7 @@ async def update_namespace(request: Request, namespace_id: str, user: CurrentUse
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    namespace.name = name
-    namespace.slug = slug
-    namespace.description = description
-    namespace.updated_at = datetime.utcnow()
-
-    await namespace.save()
+    _drop_prefetched(namespace_id)
 
     return RedirectResponse(
         url=f"/namespaces/{namespace_id}", status_code=status.HTTP_302_FOUND
@@ -203,11 +324,13 @@ async def update_namespace(request: Request, namespace_id: str, user: CurrentUse
 @router.post("/{namespace_id}/delete")
 async def delete_namespace(namespace_id: str, user: CurrentUser):
     """Delete a namespace and all its projects."""
-    namespace = await Namespace.get(namespace_id)
-    if namespace:
-        # Delete all projects in this namespace (notification groups are global, don't delete)
-        await Project.find(Project.namespace_id == str(namespace.id)).delete()
-        await namespace.delete()
+    if ObjectId.is_valid(namespace_id):
+        # Delete all projects first so a failure never orphans them, then the
+        # namespace (notification groups are global, don't delete)
+        await Project.find(Project.namespace_id == namespace_id).delete()
+        await Namespace.find_one(Namespace.id == PydanticObjectId(namespace_id)).delete()
+        _drop_prefetched(namespace_id)
+        invalidate_all_projects()
 
     return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
@@ -222,13 +345,8 @@ async def new_project_form(request: Request, namespace_id: str, user: CurrentUse
     if not namespace:
         return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
-    # Get all notification groups for binding
-    all_groups = await NotificationGroup.find().sort(NotificationGroup.name).to_list()
-
-    # Get all notification templates
-    all_templates = (
-        await NotificationTemplate.find().sort(NotificationTemplate.name).to_list()
-    )
+    # Notification groups for binding and templates to choose from
+    all_groups, all_templates = await _load_form_options()
 
     return templates.TemplateResponse(
         request,
@@ -283,6 +401,11 @@ async def create_project(request: Request, namespace_id: str, user: CurrentUser)
         ),
     )
     await project.insert()
+    await Namespace.find_one(Namespace.id == namespace.id).update(
+        {"$inc": {Namespace.project_count: 1}}
+    )
+    _drop_prefetched(namespace_id)
+    invalidate_all_projects()
 
     return RedirectResponse(
         url=f"/namespaces/{namespace_id}", status_code=status.HTTP_302_FOUND
@@ -294,23 +417,15 @@ async def view_project(
     request: Request, namespace_id: str, project_id: str, user: CurrentUser
 ):
     """View project details and bound notification groups."""
-    namespace = await Namespace.get(namespace_id)
-    project = await Project.get(project_id)
+    # Independent lookups, issued concurrently
+    detail, contacts_map = await asyncio.gather(
+        fetch_project_detail(project_id), get_contacts_map()
+    )
 
-    if not namespace or not project:
+    if not detail:
         return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
-    # Get bound notification groups in order
-    bound_groups = []
-    for group_id in project.notification_group_ids:
-        group = await NotificationGroup.get(group_id)
-        if group:
-            bound_groups.append(group)
-
-    # Get all contacts for reference
-    contacts = await Contact.find().to_list()
-    contacts_map = {str(c.id): c for c in contacts}
-
+    namespace, project, bound_groups = detail
     settings = get_settings()
 
     return templates.TemplateResponse(
@@ -341,13 +456,8 @@ async def edit_project_form(
     if not namespace or not project:
         return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
-    # Get all notification groups for binding
-    all_groups = await NotificationGroup.find().sort(NotificationGroup.name).to_list()
-
-    # Get all notification templates
-    all_templates = (
-        await NotificationTemplate.find().sort(NotificationTemplate.name).to_list()
-    )
+    # Notification groups for binding and templates to choose from
+    all_groups, all_templates = await _load_form_options()
 
     return templates.TemplateResponse(
         request,
@@ -407,6 +517,8 @@ async def update_project(
     project.updated_at = datetime.utcnow()
 
     await project.save()
+    _drop_prefetched(namespace_id)
+    invalidate_all_projects()
 
     return RedirectResponse(
         url=f"/namespaces/{namespace_id}/projects/{project_id}",
@@ -417,9 +529,17 @@ async def update_project(
 @router.post("/{namespace_id}/projects/{project_id}/delete")
 async def delete_project(namespace_id: str, project_id: str, user: CurrentUser):
     """Delete a project (notification groups are global, not deleted)."""
-    project = await Project.get(project_id)
-    if project:
-        await project.delete()
+    if ObjectId.is_valid(namespace_id) and ObjectId.is_valid(project_id):
+        result = await Project.find_one(
+            Project.id == PydanticObjectId(project_id),
+            Project.namespace_id == namespace_id,
+        ).delete()
+        if result and result.deleted_count:
+            await Namespace.find_one(
+                Namespace.id == PydanticObjectId(namespace_id)
+            ).update({"$inc": {Namespace.project_count: -1}})
+        _drop_prefetched(namespace_id)
+        invalidate_all_projects()
 
     return RedirectResponse(
         url=f"/namespaces/{namespace_id}", status_code=status.HTTP_302_FOUND
@@ -448,6 +568,7 @@ async def silence_project(
     project.silenced_until = datetime.utcnow() + timedelta(minutes=duration_minutes)
     project.updated_at = datetime.utcnow()
     await project.save()
+    _drop_prefetched(namespace_id)
 
     return RedirectResponse(
         url=f"/namespaces/{namespace_id}/projects/{project_id}",
@@ -467,6 +588,7 @@ async def unsilence_project(namespace_id: str, project_id: str, user: CurrentUse
     project.silenced_until = None
     project.updated_at = datetime.utcnow()
     await project.save()
+    _drop_prefetched(namespace_id)
 
     return RedirectResponse(
         url=f"/namespaces/{namespace_id}/projects/{project_id}",
@@ -479,12 +601,12 @@ async def send_test_message(
     request: Request, namespace_id: str, project_id: str, user: CurrentUser
 ):
     """Send a test notification to the first notification group."""
-    namespace = await Namespace.get(namespace_id)
-    project = await Project.get(project_id)
-
-    if not namespace or not project:
+    detail = await fetch_project_detail(project_id)
+    if not detail:
         return RedirectResponse(url="/namespaces", status_code=status.HTTP_302_FOUND)
 
+    namespace, project, bound_groups = detail
+
     form_data = await request.form()
     title_raw = form_data.get("title", "")
     title = (title_raw.strip() if isinstance(title_raw, str) else "") or "测试告警"
@@ -503,11 +625,16 @@ async def send_test_message(
             project,
             user,
             test_result={"success": False, "message": "项目未配置通知组"},
+            bound_groups=bound_groups,
         )
 
-    # Get the first notification group
+    # The first notification group, if it still exists, leads the bound groups
     first_group_id = project.notification_group_ids[0]
-    first_group = await NotificationGroup.get(first_group_id)
+    first_group = (
+        bound_groups[0]
+        if bound_groups and str(bound_groups[0].id) == first_group_id
+        else None
+    )
 
     if not first_group:
         return await _render_project_detail_with_test_result(
@@ -516,24 +643,25 @@ async def send_test_message(
             project,
             user,
             test_result={"success": False, "message": "第一级通知组不存在"},
+            bound_groups=bound_groups,
         )
 
+    # Get template for project
+    template = await TemplateService.get_template_for_project(project)
+
     # Create a temporary ticket object (not saved to DB)
     test_ticket = Ticket(
         project_id=str(project.id),
         source="test",
         status=TicketStatus.PENDING,
-        payload={"test": True},
+        payload=_TEST_TICKET_PAYLOAD,
         title=title,
         description=description,
         severity=severity,
-        labels={"env": "test", "type": "test_message"},
-        ack_token=secrets.token_urlsafe(32),
+        labels=_TEST_TICKET_LABELS,
+        ack_token=_TEST_TICKET_ACK_TOKEN,
     )
 
-    # Get template for project
-    template = await TemplateService.get_template_for_project(project)
-
     # Send notification to the first group
     try:
         results = await NotificationService.send_to_group(
@@ -575,7 +703,12 @@ async def send_test_message(
         test_result = {"success": False, "message": f"发送异常: {str(e)}"}
 
     return await _render_project_detail_with_test_result(
-        request, namespace, project, user, test_result=test_result
+        request,
+        namespace,
+        project,
+        user,
+        test_result=test_result,
+        bound_groups=bound_groups,
     )
 
 
@@ -585,18 +718,10 @@ async def _render_project_detail_with_test_result(
     project: Project,
     user,
     test_result: dict,
+    bound_groups: list[NotificationGroup],
 ):
     """Render project detail page with test result."""
-    # Get bound notification groups in order
-    bound_groups = []
-    for group_id in project.notification_group_ids:
-        group = await NotificationGroup.get(group_id)
-        if group:
-            bound_groups.append(group)
-
-    # Get all contacts for reference
-    contacts = await Contact.find().to_list()
-    contacts_map = {str(c.id): c for c in contacts}
+    contacts_map = await get_contacts_map()
 
     settings = get_settings()
 
@@ -1,9 +1,16 @@
 """Notification group management routes - global resources."""
 
+import asyncio
+import re
 from datetime import datetime
+from typing import Any
 
+from beanie import PydanticObjectId
+from bson import ObjectId
 from fastapi import APIRouter, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
+from pymongo.errors import DuplicateKeyError
+from starlette.datastructures import FormData
 
 from app.deps import CurrentUser
 from app.models.contact import Contact
@@ -18,13 +25,65 @@ from app.web.templates import templates
 router = APIRouter(prefix="/notification-groups", tags=["notification_groups"])
 
 
+# Channel type choices offered by the group form
+_CHANNEL_TYPES: list[str] = [t.value for t in ChannelType]
+
+# Matches channel_{i}_type / channel_{i}_contacts form fields
+_CHANNEL_FIELD = re.compile(r"channel_(\d+)_(type|contacts)")
+
+
+def _parse_channel_configs(form_data: FormData) -> list[ChannelConfig]:
+    """Parse channel configs from the group form in a single pass."""
+    count_raw = form_data.get("channel_count", 0)
+    channel_count = (
+        int(count_raw) if isinstance(count_raw, (str, int)) and count_raw else 0
+    )
+
+    # Bucket channel fields by index: {i: {"type": str, "contacts": [str]}}
+    by_idx: dict[int, dict[str, Any]] = {}
+    for key, value in form_data.multi_items():
+        match = _CHANNEL_FIELD.fullmatch(key)
+        if not match or not isinstance(value, str):
+            continue
+        fields = by_idx.setdefault(int(match[1]), {"type": None, "contacts": []})
+        if match[2] == "type":
+            fields["type"] = value
+        else:
+            fields["contacts"].append(value)
+
+    channel_configs = []
+    for i in range(channel_count):
+        fields = by_idx.get(i)
+        if fields and fields["type"] and fields["contacts"]:
+            channel_configs.append(
+                ChannelConfig(
+                    type=ChannelType(fields["type"]),
+                    contact_ids=fields["contacts"],
+                )
+            )
+    return channel_configs
+
+
 @router.get("/", response_class=HTMLResponse)
 async def list_groups(request: Request, user: CurrentUser):
     """List all notification groups."""
     groups = await NotificationGroup.find().sort(NotificationGroup.name).to_list()
 
-    # Get all contacts for display
-    contacts = await Contact.find().to_list()
+    # Fetch only the contacts the listed groups reference
+    referenced_ids = {
+        cid
+        for g in groups
+        for config in g.channel_configs
+        for cid in config.contact_ids
+        if ObjectId.is_valid(cid)
+    }
+    contacts = (
+        await Contact.find(
+            {"_id": {"$in": [ObjectId(cid) for cid in referenced_ids]}}
+        ).to_list()
+        if referenced_ids
+        else []
+    )
     contacts_map = {str(c.id): c for c in contacts}
 
     return templates.TemplateResponse(
@@ -38,7 +97,6 @@ async def list_groups(request: Request, user: CurrentUser):
 async def new_group_form(request: Request, user: CurrentUser):
     """Display new notification group form."""
     contacts = await Contact.find().sort(Contact.name).to_list()
-    channel_types = [t.value for t in ChannelType]
 
     return templates.TemplateResponse(
         request,
@@ -47,7 +105,7 @@ async def new_group_form(request: Request, user: CurrentUser):
             "user": user,
             "group": None,
             "contacts": contacts,
-            "channel_types": channel_types,
+            "channel_types": _CHANNEL_TYPES,
             "repeat_interval_options": REPEAT_INTERVAL_OPTIONS,
             "error": None,
         },
@@ -71,11 +129,20 @@ async def create_group(request: Request, user: CurrentUser):
     if repeat_interval == 0:
         repeat_interval = None
 
-    # Check if name already exists
-    existing = await NotificationGroup.find_one(NotificationGroup.name == name)
-    if existing:
+    channel_configs = _parse_channel_configs(form_data)
+
+    group = NotificationGroup(
+        name=name,
+        description=description,
+        repeat_interval=repeat_interval,
+        channel_configs=channel_configs,
+    )
+
+    # The unique index on name rejects duplicates
+    try:
+        await group.insert()
+    except DuplicateKeyError:
         contacts = await Contact.find().sort(Contact.name).to_list()
-        channel_types = [t.value for t in ChannelType]
         return templates.TemplateResponse(
             request,
             "notification_groups/form.html",
@@ -83,40 +150,13 @@ async def create_group(request: Request, user: CurrentUser):
                 "user": user,
                 "group": None,
                 "contacts": contacts,
-                "channel_types": channel_types,
+                "channel_types": _CHANNEL_TYPES,
                 "repeat_interval_options": REPEAT_INTERVAL_OPTIONS,
                 "error": f"Name '{name}' already exists",
             },
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Parse channel configs from form
-    channel_configs = []
-    count_raw = form_data.get("channel_count", 0)
-    channel_count = (
-        int(count_raw) if isinstance(count_raw, (str, int)) and count_raw else 0
-    )
-
-    for i in range(channel_count):
-        channel_type = form_data.get(f"channel_{i}_type")
-        contact_ids = form_data.getlist(f"channel_{i}_contacts")
-
-        if channel_type and contact_ids:
-            channel_configs.append(
-                ChannelConfig(
-                    type=ChannelType(channel_type),
-                    contact_ids=list(contact_ids), #type: ignore[reportArgumentType]
-                )
-            )
-
-    group = NotificationGroup(
-        name=name,
-        description=description,
-        repeat_interval=repeat_interval,
-        channel_configs=channel_configs,
-    )
-    await group.insert()
-
     return RedirectResponse(
         url="/notification-groups", status_code=status.HTTP_302_FOUND
     )
@@ -125,16 +165,16 @@ async def create_group(request: Request, user: CurrentUser):
 @router.get("/{group_id}/edit", response_class=HTMLResponse)
 async def edit_group_form(request: Request, group_id: str, user: CurrentUser):
     """Display edit notification group form."""
-    group = await NotificationGroup.get(group_id)
+    group, contacts = await asyncio.gather(
+        NotificationGroup.get(group_id),
+        Contact.find().sort(Contact.name).to_list(),
+    )
 
     if not group:
         return RedirectResponse(
             url="/notification-groups", status_code=status.HTTP_302_FOUND
         )
 
-    contacts = await Contact.find().sort(Contact.name).to_list()
-    channel_types = [t.value for t in ChannelType]
-
     return templates.TemplateResponse(
         request,
         "notification_groups/form.html",
@@ -142,7 +182,7 @@ async def edit_group_form(request: Request, group_id: str, user: CurrentUser):
             "user": user,
             "group": group,
             "contacts": contacts,
-            "channel_types": channel_types,
+            "channel_types": _CHANNEL_TYPES,
             "repeat_interval_options": REPEAT_INTERVAL_OPTIONS,
             "error": None,
         },
@@ -173,11 +213,19 @@ async def update_group(request: Request, group_id: str, user: CurrentUser):
     if repeat_interval == 0:
         repeat_interval = None
 
-    # Check if name is taken by another group
-    existing = await NotificationGroup.find_one(NotificationGroup.name == name)
-    if existing and str(existing.id) != group_id:
+    channel_configs = _parse_channel_configs(form_data)
+
+    group.name = name
+    group.description = description
+    group.repeat_interval = repeat_interval
+    group.channel_configs = channel_configs
+    group.updated_at = datetime.utcnow()
+
+    # The unique index on name rejects a name taken by another group
+    try:
+        await group.save()
+    except DuplicateKeyError:
         contacts = await Contact.find().sort(Contact.name).to_list()
-        channel_types = [t.value for t in ChannelType]
         return templates.TemplateResponse(
             request,
             "notification_groups/form.html",
@@ -185,40 +233,13 @@ async def update_group(request: Request, group_id: str, user: CurrentUser):
                 "user": user,
                 "group": group,
                 "contacts": contacts,
-                "channel_types": channel_types,
+                "channel_types": _CHANNEL_TYPES,
                 "repeat_interval_options": REPEAT_INTERVAL_OPTIONS,
                 "error": f"Name '{name}' already exists",
             },
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Parse channel configs from form
-    channel_configs = []
-    count_raw = form_data.get("channel_count", 0)
-    channel_count = (
-        int(count_raw) if isinstance(count_raw, (str, int)) and count_raw else 0
-    )
-
-    for i in range(channel_count):
-        channel_type = form_data.get(f"channel_{i}_type")
-        contact_ids = form_data.getlist(f"channel_{i}_contacts")
-
-        if channel_type and contact_ids:
-            channel_configs.append(
-                ChannelConfig(
-                    type=ChannelType(channel_type),
-                    contact_ids=list(contact_ids), #type: ignore[reportArgumentType]
-                )
-            )
-
-    group.name = name
-    group.description = description
-    group.repeat_interval = repeat_interval
-    group.channel_configs = channel_configs
-    group.updated_at = datetime.utcnow()
-
-    await group.save()
-
     return RedirectResponse(
         url="/notification-groups", status_code=status.HTTP_302_FOUND
     )
@@ -227,9 +248,10 @@ async def update_group(request: Request, group_id: str, user: CurrentUser):
 @router.post("/{group_id}/delete")
 async def delete_group(group_id: str, user: CurrentUser):
     """Delete a notification group."""
-    group = await NotificationGroup.get(group_id)
-    if group:
-        await group.delete()
+    if ObjectId.is_valid(group_id):
+        await NotificationGroup.find_one(
+            NotificationGroup.id == PydanticObjectId(group_id)
+        ).delete()
 
     return RedirectResponse(
         url="/notification-groups", status_code=status.HTTP_302_FOUND
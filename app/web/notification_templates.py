@@ -1,10 +1,16 @@
 """Notification template management routes."""
 
 from datetime import datetime
+from typing import Any
 
+from beanie import PydanticObjectId
 from fastapi import APIRouter, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import BaseModel, Field
+from pymongo.errors import DuplicateKeyError
+from starlette.datastructures import FormData
 
+from app.clock import utcnow
 from app.deps import CurrentUser
 from app.models.notification_template import NotificationTemplate
 from app.web.templates import templates
@@ -12,11 +18,70 @@ from app.web.templates import templates
 router = APIRouter(prefix="/notification-templates", tags=["notification_templates"])
 
 
+def _non_empty(field: str) -> dict[str, Any]:
+    """$project expression: whether a string field is set and non-empty."""
+    return {"$gt": [{"$strLenCP": {"$ifNull": [f"${field}", ""]}}, 0]}
+
+
+class TemplateListRow(BaseModel):
+    """Projection of a NotificationTemplate for the list page.
+
+    Only flags for which channel bodies are configured are read, not the
+    bodies themselves.
+    """
+
+    id: PydanticObjectId = Field(alias="_id")
+    name: str
+    description: str = ""
+    is_builtin: bool = False
+    updated_at: datetime
+    has_feishu_card: bool
+    has_email: bool
+    has_sms: bool
+
+    class Settings:
+        projection = {
+            "_id": 1,
+            "name": 1,
+            "description": 1,
+            "is_builtin": 1,
+            "updated_at": 1,
+            "has_feishu_card": _non_empty("feishu_card"),
+            "has_email": {
+                "$or": [_non_empty("email_subject"), _non_empty("email_body")]
+            },
+            "has_sms": _non_empty("sms_message"),
+        }
+
+
+# Editable text fields submitted by the template form
+_TEMPLATE_FIELDS = (
+    "name",
+    "description",
+    "feishu_card",
+    "email_subject",
+    "email_body",
+    "sms_message",
+)
+
+
+def _extract_template_fields(form_data: FormData) -> dict[str, str]:
+    """Read the template form's text fields, stripped ("" if missing)."""
+    fields = {}
+    for field in _TEMPLATE_FIELDS:
+        value = form_data.get(field, "")
+        fields[field] = value.strip() if isinstance(value, str) else ""
+    return fields
+
+
 @router.get("/", response_class=HTMLResponse)
 async def list_templates(request: Request, user: CurrentUser):
     """List all notification templates."""
     template_list = (
-        await NotificationTemplate.find().sort(NotificationTemplate.name).to_list()
+        await NotificationTemplate.find()
+        .sort(NotificationTemplate.name)
+        .project(TemplateListRow)
+        .to_list()
     )
 
     return templates.TemplateResponse(
@@ -44,22 +109,14 @@ async def new_template_form(request: Request, user: CurrentUser):
 async def create_template(request: Request, user: CurrentUser):
     """Create a new notification template."""
     form_data = await request.form()
-    name_raw = form_data.get("name", "")
-    name = name_raw.strip() if isinstance(name_raw, str) else ""
-    desc_raw = form_data.get("description", "")
-    description = desc_raw.strip() if isinstance(desc_raw, str) else ""
-    feishu_raw = form_data.get("feishu_card", "")
-    feishu_card = feishu_raw.strip() if isinstance(feishu_raw, str) else ""
-    subject_raw = form_data.get("email_subject", "")
-    email_subject = subject_raw.strip() if isinstance(subject_raw, str) else ""
-    body_raw = form_data.get("email_body", "")
-    email_body = body_raw.strip() if isinstance(body_raw, str) else ""
-    sms_raw = form_data.get("sms_message", "")
-    sms_message = sms_raw.strip() if isinstance(sms_raw, str) else ""
-
-    # Check if name already exists
-    existing = await NotificationTemplate.find_one(NotificationTemplate.name == name)
-    if existing:
+    fields = _extract_template_fields(form_data)
+    name = fields["name"]
+
+    template = NotificationTemplate(**fields, is_builtin=False)
+    # The unique index on name rejects duplicates
+    try:
+        await template.insert()
+    except DuplicateKeyError:
         return templates.TemplateResponse(
             request,
             "notification_templates/form.html",
@@ -71,17 +128,6 @@ async def create_template(request: Request, user: CurrentUser):
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    template = NotificationTemplate(
-        name=name,
-        description=description,
-        is_builtin=False,
-        feishu_card=feishu_card,
-        email_subject=email_subject,
-        email_body=email_body,
-        sms_message=sms_message,
-    )
-    await template.insert()
-
     return RedirectResponse(
         url="/notification-templates", status_code=status.HTTP_302_FOUND
     )
@@ -119,22 +165,17 @@ async def update_template(request: Request, template_id: str, user: CurrentUser)
         )
 
     form_data = await request.form()
-    name_raw = form_data.get("name", "")
-    name = name_raw.strip() if isinstance(name_raw, str) else ""
-    desc_raw = form_data.get("description", "")
-    description = desc_raw.strip() if isinstance(desc_raw, str) else ""
-    feishu_raw = form_data.get("feishu_card", "")
-    feishu_card = feishu_raw.strip() if isinstance(feishu_raw, str) else ""
-    subject_raw = form_data.get("email_subject", "")
-    email_subject = subject_raw.strip() if isinstance(subject_raw, str) else ""
-    body_raw = form_data.get("email_body", "")
-    email_body = body_raw.strip() if isinstance(body_raw, str) else ""
-    sms_raw = form_data.get("sms_message", "")
-    sms_message = sms_raw.strip() if isinstance(sms_raw, str) else ""
-
-    # Check if name is taken by another template
-    existing = await NotificationTemplate.find_one(NotificationTemplate.name == name)
-    if existing and str(existing.id) != template_id:
+    fields = _extract_template_fields(form_data)
+    name = fields["name"]
+
+    for field, value in fields.items():
+        setattr(template, field, value)
+    template.updated_at = utcnow()
+
+    # The unique index on name rejects a name taken by another template
+    try:
+        await template.save()
+    except DuplicateKeyError:
         return templates.TemplateResponse(
             request,
             "notification_templates/form.html",
@@ -146,16 +187,6 @@ async def update_template(request: Request, template_id: str, user: CurrentUser)
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    template.name = name
-    template.description = description
-    template.feishu_card = feishu_card
-    template.email_subject = email_subject
-    template.email_body = email_body
-    template.sms_message = sms_message
-    template.updated_at = datetime.utcnow()
-
-    await template.save()
-
     return RedirectResponse(
         url="/notification-templates", status_code=status.HTTP_302_FOUND
     )
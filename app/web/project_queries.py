@@ -0,0 +1,79 @@
+"""Aggregated MongoDB queries backing the project detail pages."""
+
+from typing import Any, NamedTuple
+
+from bson import ObjectId
+
+from app.models import Namespace, NotificationGroup, Project
+
+
+class ProjectDetail(NamedTuple):
+    """A project with its namespace and bound groups in escalation order."""
+
+    namespace: Namespace
+    project: Project
+    bound_groups: list[NotificationGroup]
+
+
+def _to_object_id(expr: str) -> dict[str, Any]:
+    """Convert a string id expression to ObjectId, yielding null if malformed."""
+    return {
+        "$convert": {"input": expr, "to": "objectId", "onError": None, "onNull": None}
+    }
+
+
+async def fetch_project_detail(project_id: str) -> ProjectDetail | None:
+    """Load a project, its namespace and its bound groups in one round-trip.
+
+    Projects reference namespaces and groups by string id, so both $lookup
+    stages convert those ids to ObjectId before matching on _id.
+    """
+    if not ObjectId.is_valid(project_id):
+        return None
+
+    pipeline: list[dict[str, Any]] = [
+        {"$match": {"_id": ObjectId(project_id)}},
+        {
+            "$lookup": {
+                "from": Namespace.get_collection_name(),
+                "let": {"namespace_id": _to_object_id("$namespace_id")},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$namespace_id"]}}}
+                ],
+                "as": "_namespace",
+            }
+        },
+        {
+            "$lookup": {
+                "from": NotificationGroup.get_collection_name(),
+                "let": {
+                    "group_ids": {
+                        "$map": {
+                            "input": "$notification_group_ids",
+                            "in": _to_object_id("$$this"),
+                        }
+                    }
+                },
+                "pipeline": [{"$match": {"$expr": {"$in": ["$_id", "$$group_ids"]}}}],
+                "as": "_groups",
+            }
+        },
+    ]
+
+    docs = await Project.aggregate(pipeline).to_list()
+    if not docs or not docs[0]["_namespace"]:
+        return None
+
+    doc = docs[0]
+    namespace = Namespace.model_validate(doc.pop("_namespace")[0])
+    groups_map = {
+        str(group.id): group
+        for group in map(NotificationGroup.model_validate, doc.pop("_groups"))
+    }
+    project = Project.model_validate(doc)
+
+    # $lookup returns groups in collection order; restore the escalation order
+    bound_groups = [
+        groups_map[gid] for gid in project.notification_group_ids if gid in groups_map
+    ]
+    return ProjectDetail(namespace, project, bound_groups)
@@ -0,0 +1,23 @@
+"""Short-lived in-process cache of the full project list."""
+
+from app.models.project import Project
+from app.web.ttl_cache import TTLCache
+
+
+async def _load_all_projects() -> list[Project]:
+    return await Project.find().to_list()
+
+
+# Projects change rarely but fill the ticket list's filter dropdown on every
+# page view
+_projects_cache = TTLCache(_load_all_projects)
+
+
+async def get_all_projects() -> list[Project]:
+    """Get all projects."""
+    return await _projects_cache.get()
+
+
+def invalidate_all_projects() -> None:
+    """Drop the cached list after a project is created, updated or deleted."""
+    _projects_cache.invalidate()
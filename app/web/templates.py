@@ -3,13 +3,42 @@
 from pathlib import Path
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from app.config import get_settings
 
 # Template directory
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
+# Templates are pure data rendering with no awaits, so keep the environment
+# synchronous and avoid per-render coroutine overhead. Compiled templates are
+# kept in memory and as bytecode on disk; source files are only re-checked
+# when auto reload is enabled (development).
+_env = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=True,
+    enable_async=False,
+    auto_reload=get_settings().template_auto_reload,
+    cache_size=1000,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
 # Initialize Jinja2 templates
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+templates = Jinja2Templates(env=_env)
 
 # Add custom filters and globals if needed
 templates.env.globals["app_name"] = "Bullet"
 
+
+def precompile_templates() -> int:
+    """Load every page template so the first request doesn't pay compile cost.
+
+    Returns the number of templates loaded.
+    """
+    names = [
+        path.relative_to(TEMPLATES_DIR).as_posix()
+        for path in TEMPLATES_DIR.rglob("*.html")
+    ]
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)
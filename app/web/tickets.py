@@ -1,19 +1,24 @@
 """Ticket management routes."""
 
+import asyncio
 import logging
+import re
 from datetime import datetime
 from typing import Optional
 
 from beanie import PydanticObjectId
 from fastapi import APIRouter, Query, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import BaseModel, Field
 
+from app.clock import utcnow
 from app.deps import CurrentUser
 from app.models.namespace import Namespace
 from app.models.project import Project
 from app.models.ticket import EventType, Ticket, TicketStatus
 from app.models.user import User
 from app.services.notification import NotificationService
+from app.web.projects_cache import get_all_projects
 from app.web.templates import templates
 
 logger = logging.getLogger(__name__)
@@ -21,6 +26,29 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
 
+class TicketListRow(BaseModel):
+    """Projection of the Ticket fields shown on the list page."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    title: str = ""
+    status: TicketStatus
+    severity: str = ""
+    created_at: datetime
+    project_id: Optional[str] = None
+    source: str
+
+
+# $project stage matching TicketListRow (_id is included by default); skips
+# the payload, parsed data and event timeline
+_TICKET_LIST_PROJECTION = dict.fromkeys(
+    ("title", "status", "severity", "created_at", "project_id", "source"), 1
+)
+
+# Status filter lookup and dropdown choices, fixed at import
+_STATUS_BY_VALUE: dict[str, TicketStatus] = {s.value: s for s in TicketStatus}
+_STATUS_VALUES: tuple[str, ...] = tuple(s.value for s in TicketStatus)
+
+
 @router.get("/", response_class=HTMLResponse)
 async def list_tickets(
     request: Request,
@@ -38,42 +66,66 @@ async def list_tickets(
     if project_id:
         query["project_id"] = project_id
 
-    if status_filter and status_filter != "all":
-        try:
-            query["status"] = TicketStatus(status_filter)
-        except ValueError:
-            pass
+    status_enum = _STATUS_BY_VALUE.get(status_filter) if status_filter else None
+    if status_enum:
+        query["status"] = status_enum
 
     # Execute query with pagination
     skip = (page - 1) * per_page
 
     if search:
-        # Search in title, description, source
+        # Search in title, description, source. Text indexes don't tokenize
+        # Chinese, so keep substring matching but treat the term literally
+        # (no backtracking on user metacharacters) and only pay for
+        # case-insensitive matching when the term has cased characters.
+        search_regex = {"$regex": re.escape(search)}
+        if search.lower() != search.upper():
+            search_regex["$options"] = "i"
         tickets_query = Ticket.find(
             query,
             {"$or": [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"description": {"$regex": search, "$options": "i"}},
-                {"source": {"$regex": search, "$options": "i"}},
+                {"title": search_regex},
+                {"description": search_regex},
+                {"source": search_regex},
             ]}
         )
     else:
         tickets_query = Ticket.find(query)
 
-    total = await tickets_query.count()
-    tickets = await tickets_query.sort(-Ticket.created_at).skip(skip).limit(per_page).to_list() # type: ignore
-
-    # Get project info for each ticket
-    project_ids = list(set(t.project_id for t in tickets if t.project_id))
-    if project_ids:
-        project_object_ids = [PydanticObjectId(pid) for pid in project_ids]
-        projects = await Project.find({"_id": {"$in": project_object_ids}}).to_list()
-    else:
-        projects = []
-    projects_map = {str(p.id): p for p in projects}
-
-    # Get all projects for filter dropdown
-    all_projects = await Project.find().to_list()
+    # Page and total count in one aggregation; the filter dropdown's project
+    # list is independent, so fetch it concurrently. Sorting ahead of $facet
+    # lets the sort use the created_at index.
+    page_pipeline = [
+        {"$sort": {"created_at": -1}},
+        {
+            "$facet": {
+                "data": [
+                    {"$skip": skip},
+                    {"$limit": per_page},
+                    {"$project": _TICKET_LIST_PROJECTION},
+                ],
+                "total": [{"$count": "n"}],
+            }
+        },
+    ]
+    (facet,), all_projects = await asyncio.gather(
+        tickets_query.aggregate(page_pipeline).to_list(),
+        get_all_projects(),
+    )
+    tickets = [TicketListRow.model_validate(doc) for doc in facet["data"]]
+    total = facet["total"][0]["n"] if facet["total"] else 0
+
+    # Get project info for each ticket from the dropdown's project list; only
+    # projects created elsewhere since the cache was filled need a query
+    projects_map = {str(p.id): p for p in all_projects}
+    missing_ids = {
+        PydanticObjectId(t.project_id)
+        for t in tickets
+        if t.project_id and t.project_id not in projects_map
+    }
+    if missing_ids:
+        projects = await Project.find({"_id": {"$in": list(missing_ids)}}).to_list()
+        projects_map.update((str(p.id), p) for p in projects)
 
     # Pagination info
     total_pages = (total + per_page - 1) // per_page
@@ -93,11 +145,18 @@ async def list_tickets(
             "project_id": project_id,
             "status_filter": status_filter,
             "search": search,
-            "statuses": [s.value for s in TicketStatus],
+            "statuses": _STATUS_VALUES,
         },
     )
 
 
+async def _get_acknowledger(ticket: Ticket) -> Optional[User]:
+    """Get the user who acknowledged a ticket (None for link acks)."""
+    if ticket.acknowledged_by and ticket.acknowledged_by != "link":
+        return await User.get(ticket.acknowledged_by)
+    return None
+
+
 @router.get("/{ticket_id}", response_class=HTMLResponse)
 async def view_ticket(request: Request, ticket_id: str, user: CurrentUser):
     """View ticket details."""
@@ -105,15 +164,12 @@ async def view_ticket(request: Request, ticket_id: str, user: CurrentUser):
     if not ticket:
         return RedirectResponse(url="/tickets", status_code=status.HTTP_302_FOUND)
 
-    # Get project and namespace info
-    project = await Project.get(ticket.project_id)
+    # Project and acknowledger are independent; the namespace needs the project
+    project, acknowledger = await asyncio.gather(
+        Project.get(ticket.project_id), _get_acknowledger(ticket)
+    )
     namespace = await Namespace.get(project.namespace_id) if project else None
 
-    # Get acknowledger info
-    acknowledger = None
-    if ticket.acknowledged_by and ticket.acknowledged_by != "link":
-        acknowledger = await User.get(ticket.acknowledged_by)
-
     return templates.TemplateResponse(
         request,
         "tickets/detail.html",
@@ -135,10 +191,11 @@ async def acknowledge_ticket(ticket_id: str, user: CurrentUser):
         return RedirectResponse(url="/tickets", status_code=status.HTTP_302_FOUND)
 
     if ticket.status == TicketStatus.PENDING or ticket.status == TicketStatus.ESCALATED:
+        now = utcnow()
         ticket.status = TicketStatus.ACKNOWLEDGED
-        ticket.acknowledged_at = datetime.utcnow()
+        ticket.acknowledged_at = now
         ticket.acknowledged_by = str(user.id)
-        ticket.updated_at = datetime.utcnow()
+        ticket.updated_at = now
         ticket.add_event(
             EventType.ACKNOWLEDGED,
             details=f"由 {user.username} 确认",
@@ -162,9 +219,10 @@ async def resolve_ticket(ticket_id: str, user: CurrentUser):
         return RedirectResponse(url="/tickets", status_code=status.HTTP_302_FOUND)
 
     if ticket.status != TicketStatus.RESOLVED:
+        now = utcnow()
         ticket.status = TicketStatus.RESOLVED
-        ticket.resolved_at = datetime.utcnow()
-        ticket.updated_at = datetime.utcnow()
+        ticket.resolved_at = now
+        ticket.updated_at = now
         ticket.add_event(
             EventType.RESOLVED,
             details=f"由 {user.username} 标记解决",
@@ -0,0 +1,35 @@
+"""Short-lived in-process cache for rarely changing lookup data."""
+
+import time
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """Cache the result of an async loader for ttl seconds.
+
+    Handlers invalidate the cache after writes. The TTL bounds staleness
+    across worker processes that don't see local invalidation.
+    """
+
+    def __init__(self, loader: Callable[[], Awaitable[T]], ttl: float = 30.0):
+        self._loader = loader
+        self._ttl = ttl
+        # (monotonic timestamp, value) of the last load
+        self._entry: Optional[tuple[float, T]] = None
+
+    async def get(self) -> T:
+        """Get the cached value, reloading it once it's older than the TTL."""
+        if self._entry is not None:
+            cached_at, value = self._entry
+            if time.monotonic() - cached_at < self._ttl:
+                return value
+
+        value = await self._loader()
+        self._entry = (time.monotonic(), value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next get reloads it."""
+        self._entry = None
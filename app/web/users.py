@@ -1,11 +1,17 @@
 """User management routes."""
 
 from datetime import datetime
+from typing import Optional
 
+from beanie import PydanticObjectId
+from bson import ObjectId
 from fastapi import APIRouter, Form, Request, status
 from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import BaseModel, Field
+from pymongo.errors import DuplicateKeyError
 
 from app.auth.utils import hash_password
+from app.clock import utcnow
 from app.deps import AdminUser
 from app.models.user import User, UserRole
 from app.web.templates import templates
@@ -13,10 +19,30 @@ from app.web.templates import templates
 router = APIRouter(prefix="/users", tags=["users"])
 
 
+# Role dropdown choices, fixed at import
+_ROLE_CHOICES: tuple[UserRole, ...] = tuple(UserRole)
+
+
+class UserListRow(BaseModel):
+    """Projection of the User fields shown on the list page (no password hash)."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    username: str
+    email: Optional[str] = None
+    role: UserRole
+    is_active: bool
+    created_at: datetime
+
+
 @router.get("/", response_class=HTMLResponse)
 async def list_users(request: Request, admin: AdminUser):
     """List all users."""
-    users = await User.find().sort(User.created_at).to_list() # type: ignore
+    users = (
+        await User.find()
+        .sort(User.created_at) # type: ignore
+        .project(UserListRow)
+        .to_list()
+    )
     return templates.TemplateResponse(
         request,
         "users/list.html",
@@ -30,7 +56,7 @@ async def new_user_form(request: Request, admin: AdminUser):
     return templates.TemplateResponse(
         request,
         "users/form.html",
-        {"user": admin, "target_user": None, "roles": UserRole, "error": None},
+        {"user": admin, "target_user": None, "roles": _ROLE_CHOICES, "error": None},
     )
 
 
@@ -44,44 +70,52 @@ async def create_user(
     role: str = Form("user"),
 ):
     """Create a new user."""
-    # Check if username already exists
-    existing = await User.find_one(User.username == username)
-    if existing:
+    new_user = User(
+        username=username,
+        password_hash=hash_password(password),
+        email=email if email else None,
+        role=UserRole(role),
+        is_active=True,
+    )
+    # The unique index on username rejects duplicates. The password is hashed
+    # before the conflict is known, so a duplicate pays one bcrypt hash; that
+    # is rare on this admin-only form and cheaper than a lookup on every create
+    try:
+        await new_user.insert()
+    except DuplicateKeyError:
         return templates.TemplateResponse(
             request,
             "users/form.html",
             {
                 "user": admin,
                 "target_user": None,
-                "roles": UserRole,
+                "roles": _ROLE_CHOICES,
                 "error": "Username already exists",
             },
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    new_user = User(
-        username=username,
-        password_hash=hash_password(password),
-        email=email if email else None,
-        role=UserRole(role),
-        is_active=True,
-    )
-    await new_user.insert()
-
     return RedirectResponse(url="/users", status_code=status.HTTP_302_FOUND)
 
 
+async def _get_target_user(user_id: str, admin: User) -> Optional[User]:
+    """Get the user being managed, reusing the loaded admin on self-edits."""
+    if user_id == str(admin.id):
+        return admin
+    return await User.get(user_id)
+
+
 @router.get("/{user_id}", response_class=HTMLResponse)
 async def edit_user_form(request: Request, user_id: str, admin: AdminUser):
     """Display edit user form."""
-    target_user = await User.get(user_id)
+    target_user = await _get_target_user(user_id, admin)
     if not target_user:
         return RedirectResponse(url="/users", status_code=status.HTTP_302_FOUND)
 
     return templates.TemplateResponse(
         request,
         "users/form.html",
-        {"user": admin, "target_user": target_user, "roles": UserRole, "error": None},
+        {"user": admin, "target_user": target_user, "roles": _ROLE_CHOICES, "error": None},
     )
 
 
@@ -97,45 +131,43 @@ async def update_user(
     is_active: bool = Form(False),
 ):
     """Update a user."""
-    target_user = await User.get(user_id)
+    target_user = await _get_target_user(user_id, admin)
     if not target_user:
         return RedirectResponse(url="/users", status_code=status.HTTP_302_FOUND)
 
-    # Check if username is taken by another user
-    existing = await User.find_one(User.username == username)
-    if existing and str(existing.id) != user_id:
+    target_user.username = username
+    target_user.email = email if email else None
+    target_user.role = UserRole(role)
+    target_user.is_active = is_active
+    target_user.updated_at = utcnow()
+
+    if password:
+        target_user.password_hash = hash_password(password)
+
+    # The unique index on username rejects a name taken by another user
+    try:
+        await target_user.save()
+    except DuplicateKeyError:
         return templates.TemplateResponse(
             request,
             "users/form.html",
             {
                 "user": admin,
                 "target_user": target_user,
-                "roles": UserRole,
+                "roles": _ROLE_CHOICES,
                 "error": "Username already taken",
             },
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
-    target_user.username = username
-    target_user.email = email if email else None
-    target_user.role = UserRole(role)
-    target_user.is_active = is_active
-    target_user.updated_at = datetime.utcnow()
-
-    if password:
-        target_user.password_hash = hash_password(password)
-
-    await target_user.save()
-
     return RedirectResponse(url="/users", status_code=status.HTTP_302_FOUND)
 
 
 @router.post("/{user_id}/delete")
 async def delete_user(user_id: str, admin: AdminUser):
-    """Delete a user."""
-    target_user = await User.get(user_id)
-    if target_user and str(target_user.id) != str(admin.id):
-        await target_user.delete()
+    """Delete a user (admins cannot delete themselves)."""
+    if user_id != str(admin.id) and ObjectId.is_valid(user_id):
+        await User.find_one(User.id == PydanticObjectId(user_id)).delete()
 
     return RedirectResponse(url="/users", status_code=status.HTTP_302_FOUND)
 
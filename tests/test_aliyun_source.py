@@ -1,35 +1,47 @@
 """Unit tests for AliyunSource parser."""
 
 import ast
+import mmap
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+from app.models.alert import AlertGroup
 from app.sources.aliyun_pai import AliyunSource
 
 ARTIFACTS_DIR = Path(__file__).parent / "artifacts"
 
 
+STATUS_PREFIX = "任务状态："
+
+
 def load_payloads() -> dict[str, dict]:
     """Load test payloads from aliyun.jsonl, indexed by task status."""
     payloads = {}
-    with open(ARTIFACTS_DIR / "aliyun.jsonl") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+    # Lines are Python reprs (single quotes), not JSON, hence literal_eval
+    with (
+        open(ARTIFACTS_DIR / "aliyun.jsonl", "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        for raw_line in iter(mm.readline, b""):
+            raw_line = raw_line.strip()
+            if not raw_line:
                 continue
-            payload = ast.literal_eval(line)
-            # Extract task status from payload
+            payload = ast.literal_eval(raw_line.decode())
+            # Extract task status from payload, stopping at the first match
             content = payload["content"]["post"]["zh_cn"]["content"]
             for item_list in content:
                 for item in item_list:
-                    if item.get("tag") == "text" and "任务状态：" in item.get(
-                        "text", ""
-                    ):
-                        status = item["text"].split("：")[1]
-                        payloads[status] = payload
+                    if item.get("tag") != "text":
+                        continue
+                    text = item.get("text", "")
+                    if STATUS_PREFIX in text:
+                        payloads[text.split("：", 1)[1]] = payload
                         break
+                else:
+                    continue
+                break
     return payloads
 
 
@@ -39,6 +51,13 @@ def payloads() -> dict[str, dict]:
     return load_payloads()
 
 
+@pytest.fixture(scope="module")
+def parsed(payloads: dict[str, dict]) -> dict[str, AlertGroup]:
+    """Parse each test payload once, indexed by task status."""
+    source = AliyunSource()
+    return {status: source.parse(payload) for status, payload in payloads.items()}
+
+
 @pytest.fixture
 def aliyun_source() -> AliyunSource:
     """Create an AliyunSource instance for testing."""
@@ -55,12 +74,9 @@ class TestAliyunSourceName:
 class TestAliyunSourceParse:
     """Tests for the parse method."""
 
-    def test_parse_running_task(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
-    ):
+    def test_parse_running_task(self, parsed: dict[str, AlertGroup]):
         """Test parsing a running task notification."""
-        payload = payloads["Running"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Running"]
 
         assert result.source == "aliyun_pai"
         assert result.status == "ignored"
@@ -75,12 +91,9 @@ class TestAliyunSourceParse:
         assert alert.description == "任务已开始运行"
         assert alert.ends_at is None
 
-    def test_parse_succeeded_task(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
-    ):
+    def test_parse_succeeded_task(self, parsed: dict[str, AlertGroup]):
         """Test parsing a succeeded task notification."""
-        payload = payloads["Succeeded"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Succeeded"]
 
         assert result.status == "ignored"
         alert = result.alerts[0]
@@ -88,32 +101,25 @@ class TestAliyunSourceParse:
         assert alert.severity == "info"
         assert alert.ends_at is None
 
-    def test_parse_queuing_task(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
-    ):
+    def test_parse_queuing_task(self, parsed: dict[str, AlertGroup]):
         """Test parsing a queuing task notification."""
-        payload = payloads["Queuing"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Queuing"]
 
         assert result.status == "ignored"
         alert = result.alerts[0]
         assert alert.severity == "info"
 
-    def test_parse_env_preparing_task(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
-    ):
+    def test_parse_env_preparing_task(self, parsed: dict[str, AlertGroup]):
         """Test parsing an env preparing task notification."""
-        payload = payloads["EnvPreparing"]
-        result = aliyun_source.parse(payload)
+        result = parsed["EnvPreparing"]
 
         assert result.status == "ignored"
         alert = result.alerts[0]
         assert alert.severity == "info"
 
-    def test_parse_labels(self, aliyun_source: AliyunSource, payloads: dict[str, dict]):
+    def test_parse_labels(self, parsed: dict[str, AlertGroup]):
         """Test that labels are correctly extracted."""
-        payload = payloads["Running"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Running"]
 
         alert = result.alerts[0]
         assert alert.labels["task_name"] == "debug-webhook_clone"
@@ -123,33 +129,26 @@ class TestAliyunSourceParse:
         assert alert.labels["region"] == "ap-southeast-1"
         assert alert.labels["creator"] == "leilei"
 
-    def test_parse_annotations(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
-    ):
+    def test_parse_annotations(self, parsed: dict[str, AlertGroup]):
         """Test that annotations are correctly extracted."""
-        payload = payloads["Running"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Running"]
 
         alert = result.alerts[0]
         assert alert.annotations["event"] == "开始运行"
         assert alert.annotations["message"] == "任务已开始运行"
         assert alert.annotations["creator_uid"] == "211790764591639068"
 
-    def test_parse_url(self, aliyun_source: AliyunSource, payloads: dict[str, dict]):
+    def test_parse_url(self, parsed: dict[str, AlertGroup]):
         """Test that URL is correctly extracted."""
         expected_url = "https://pai.console.aliyun.com/?regionId=ap-southeast-1&workspaceId=249407#/job/detail?jobId=dlc1gbd4p5lft9tx&page=jobs"
-        payload = payloads["Running"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Running"]
 
         assert result.external_url == expected_url
         assert result.alerts[0].generator_url == expected_url
 
-    def test_parse_start_time(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
-    ):
+    def test_parse_start_time(self, parsed: dict[str, AlertGroup]):
         """Test that start time is correctly parsed."""
-        payload = payloads["Running"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Running"]
 
         alert = result.alerts[0]
         assert alert.starts_at.year == 2026
@@ -159,11 +158,11 @@ class TestAliyunSourceParse:
         assert alert.starts_at.minute == 18
 
     def test_parse_raw_payload_preserved(
-        self, aliyun_source: AliyunSource, payloads: dict[str, dict]
+        self, payloads: dict[str, dict], parsed: dict[str, AlertGroup]
     ):
         """Test that raw payload is preserved."""
         payload = payloads["Running"]
-        result = aliyun_source.parse(payload)
+        result = parsed["Running"]
 
         assert result.raw == payload
         assert result.alerts[0].raw == payload
@@ -0,0 +1,131 @@
+"""Unit tests for contact list helpers."""
+
+from bson import ObjectId
+
+from app.web.contacts import (
+    ContactDisplay,
+    _keyset_query,
+    _parse_csv,
+    _stars,
+    mask_email,
+    mask_phone,
+)
+
+
+class TestParseCsv:
+    """Tests for _parse_csv."""
+
+    def test_strips_items(self):
+        assert _parse_csv(" a@x.com , b@x.com ") == ["a@x.com", "b@x.com"]
+
+    def test_drops_empty_items(self):
+        assert _parse_csv("a,, ,b,") == ["a", "b"]
+
+    def test_empty(self):
+        assert _parse_csv("") == []
+        assert _parse_csv(" , ") == []
+
+
+class TestKeysetQuery:
+    """Tests for _keyset_query."""
+
+    def test_first_page(self):
+        """No cursor matches every contact."""
+        assert _keyset_query(None, None) == {}
+
+    def test_name_only(self):
+        """A name cursor without an id starts after that name."""
+        assert _keyset_query("bob", None) == {"name": {"$gt": "bob"}}
+
+    def test_empty_name_is_a_cursor(self):
+        """An empty name is still a cursor, not the first page."""
+        assert _keyset_query("", None) == {"name": {"$gt": ""}}
+
+    def test_breaks_name_ties_on_id(self):
+        """Contacts sharing the cursor's name continue after its id."""
+        oid = ObjectId()
+        assert _keyset_query("bob", str(oid)) == {
+            "$or": [
+                {"name": {"$gt": "bob"}},
+                {"name": "bob", "_id": {"$gt": oid}},
+            ]
+        }
+
+    def test_ignores_invalid_id(self):
+        """A malformed id falls back to the name-only cursor."""
+        assert _keyset_query("bob", "not-an-id") == {"name": {"$gt": "bob"}}
+
+
+class TestStars:
+    """Tests for _stars."""
+
+    def test_lengths(self):
+        """Runs inside and beyond the precomputed table have the right length."""
+        for n in (0, 2, 7, 64, 65, 100):
+            assert _stars(n) == "*" * n
+
+
+class TestMaskPhone:
+    """Tests for mask_phone."""
+
+    def test_too_short_to_mask(self):
+        assert mask_phone("") == ""
+        assert mask_phone("12") == "12"
+
+    def test_short_keeps_first_and_last(self):
+        assert mask_phone("123") == "1*3"
+        assert mask_phone("1234567") == "1*****7"
+
+    def test_long_keeps_prefix_and_suffix(self):
+        assert mask_phone("12345678") == "123*5678"
+        assert mask_phone("13812345678") == "138****5678"
+
+    def test_beyond_star_table(self):
+        """More than 64 hidden digits still masks every one."""
+        phone = "1" * 80
+        assert mask_phone(phone) == "111" + "*" * 73 + "1111"
+
+
+class TestMaskEmail:
+    """Tests for mask_email."""
+
+    def test_not_an_email(self):
+        assert mask_email("alice") == "alice"
+
+    def test_short_local_part_fully_masked(self):
+        assert mask_email("@example.com") == "@example.com"
+        assert mask_email("ab@example.com") == "**@example.com"
+
+    def test_keeps_first_and_last(self):
+        assert mask_email("alice@example.com") == "a***e@example.com"
+
+    def test_splits_on_last_at(self):
+        assert mask_email("a@b@example.com") == "a*b@example.com"
+
+    def test_beyond_star_table(self):
+        local = "x" * 70
+        assert mask_email(f"{local}@example.com") == "x" + "*" * 68 + "x@example.com"
+
+
+class TestContactDisplay:
+    """Tests for ContactDisplay masking validators."""
+
+    DATA = {
+        "name": "Alice",
+        "phones": ["13812345678"],
+        "emails": ["alice@example.com"],
+    }
+
+    def test_masks_for_non_admin(self):
+        contact = ContactDisplay.model_validate(self.DATA, context={"is_admin": False})
+        assert contact.phones == ["138****5678"]
+        assert contact.emails == ["a***e@example.com"]
+
+    def test_masks_without_context(self):
+        contact = ContactDisplay.model_validate(self.DATA)
+        assert contact.phones == ["138****5678"]
+
+    def test_unmasked_for_admin(self):
+        contact = ContactDisplay.model_validate(self.DATA, context={"is_admin": True})
+        assert contact.phones == ["13812345678"]
+        assert contact.emails == ["alice@example.com"]
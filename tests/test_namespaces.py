@@ -0,0 +1,23 @@
+"""Unit tests for namespace helpers."""
+
+from app.web.namespaces import slugify
+
+
+class TestSlugify:
+    """Tests for slugify."""
+
+    def test_lowercases_and_dashes_spaces(self):
+        assert slugify("  My Service  ") == "my-service"
+
+    def test_strips_punctuation(self):
+        assert slugify("Hello, World!") == "hello-world"
+
+    def test_collapses_runs(self):
+        assert slugify("a - b__c   d") == "a-b__c-d"
+
+    def test_keeps_unicode_word_characters(self):
+        assert slugify("支付 服务") == "支付-服务"
+
+    def test_empty(self):
+        assert slugify("") == ""
+        assert slugify("!!!") == ""
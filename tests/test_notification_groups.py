@@ -0,0 +1,89 @@
+"""Unit tests for notification group form parsing."""
+
+from starlette.datastructures import FormData
+
+from app.models.notification_group import ChannelType
+from app.web.notification_groups import _parse_channel_configs
+
+
+class TestParseChannelConfigs:
+    """Tests for _parse_channel_configs."""
+
+    def test_orders_channels_by_index(self):
+        """Channels come back in index order, not form field order."""
+        form = FormData(
+            [
+                ("channel_count", "2"),
+                ("channel_1_type", "email"),
+                ("channel_1_contacts", "c3"),
+                ("channel_0_type", "feishu"),
+                ("channel_0_contacts", "c1"),
+                ("channel_0_contacts", "c2"),
+            ]
+        )
+        configs = _parse_channel_configs(form)
+
+        assert [c.type for c in configs] == [ChannelType.FEISHU, ChannelType.EMAIL]
+        assert configs[0].contact_ids == ["c1", "c2"]
+        assert configs[1].contact_ids == ["c3"]
+
+    def test_multi_digit_index(self):
+        """Indexes above 9 are parsed as integers, not by prefix."""
+        form = FormData(
+            [("channel_count", "11")]
+            + [("channel_10_type", "sms"), ("channel_10_contacts", "c1")]
+            + [("channel_1_type", "slack"), ("channel_1_contacts", "c2")]
+        )
+        configs = _parse_channel_configs(form)
+
+        assert [c.type for c in configs] == [ChannelType.SLACK, ChannelType.SMS]
+
+    def test_skips_empty_channels(self):
+        """Channels missing a type or contacts are dropped."""
+        form = FormData(
+            [
+                ("channel_count", "3"),
+                ("channel_0_type", "feishu"),
+                ("channel_1_contacts", "c1"),
+                ("channel_2_type", "email"),
+                ("channel_2_contacts", "c2"),
+            ]
+        )
+        configs = _parse_channel_configs(form)
+
+        assert len(configs) == 1
+        assert configs[0].type == ChannelType.EMAIL
+
+    def test_ignores_indexes_beyond_count(self):
+        """Only the first channel_count channels are read."""
+        form = FormData(
+            [
+                ("channel_count", "1"),
+                ("channel_0_type", "feishu"),
+                ("channel_0_contacts", "c1"),
+                ("channel_1_type", "email"),
+                ("channel_1_contacts", "c2"),
+            ]
+        )
+        assert len(_parse_channel_configs(form)) == 1
+
+    def test_missing_count(self):
+        """Without channel_count no channels are parsed."""
+        form = FormData([("channel_0_type", "feishu"), ("channel_0_contacts", "c1")])
+        assert _parse_channel_configs(form) == []
+
+    def test_ignores_unrelated_fields(self):
+        """Fields that only resemble channel fields are ignored."""
+        form = FormData(
+            [
+                ("channel_count", "1"),
+                ("channel_0_types", "email"),
+                ("xchannel_0_contacts", "c9"),
+                ("channel_0_type", "feishu"),
+                ("channel_0_contacts", "c1"),
+            ]
+        )
+        configs = _parse_channel_configs(form)
+
+        assert configs[0].type == ChannelType.FEISHU
+        assert configs[0].contact_ids == ["c1"]
@@ -0,0 +1,55 @@
+"""Unit tests for notification template rendering."""
+
+from app.models.notification_template import NotificationTemplate
+from app.services.template import TemplateService, _json_escape
+
+
+def make_template(feishu_card: str) -> NotificationTemplate:
+    """Build a template without a database connection."""
+    return NotificationTemplate.model_construct(name="test", feishu_card=feishu_card)
+
+
+class TestJsonEscape:
+    """Tests for the json_escape filter."""
+
+    def test_none(self):
+        assert _json_escape(None) == ""
+
+    def test_special_characters(self):
+        assert _json_escape('say "hi"\n\\') == 'say \\"hi\\"\\n\\\\'
+
+    def test_non_string(self):
+        assert _json_escape(42) == "42"
+
+    def test_non_ascii(self):
+        assert _json_escape("告警") == "\\u544a\\u8b66"
+
+    def test_lone_surrogate(self):
+        """Lone surrogates (e.g. from a "\\ud800" webhook escape) are escaped."""
+        assert _json_escape("a\ud800b") == "a\\ud800b"
+
+
+class TestRenderFeishuCard:
+    """Tests for TemplateService.render_feishu_card."""
+
+    CARD = '{"title": "{{ title | je }}"}'
+
+    def test_round_trips_escaped_values(self):
+        card = TemplateService.render_feishu_card(
+            make_template(self.CARD), {"title": 'CPU "high"\n告警'}
+        )
+        assert card == {"title": 'CPU "high"\n告警'}
+
+    def test_lone_surrogate(self):
+        """Values orjson can't handle still render via the stdlib fallback."""
+        card = TemplateService.render_feishu_card(
+            make_template(self.CARD), {"title": "a\ud800b"}
+        )
+        assert card == {"title": "a\ud800b"}
+
+    def test_invalid_json(self):
+        card = TemplateService.render_feishu_card(make_template("{not json"), {})
+        assert card is None
+
+    def test_empty_template(self):
+        assert TemplateService.render_feishu_card(make_template(""), {}) is None